@@ -1,9 +1,53 @@
 import asyncio
+import collections
+import functools
+import sys
+import time
 from typing import Union, List, Tuple
 from aioserial import AioSerial
-import re
+
+# How long (in seconds) a position/sensor reading is reused before querying the Arduino again
+CACHE_TTL = 0.1
+
+# Message the Arduino prints once it has finished booting
+READY_BANNER = b"microMONET is ready for some stargazing!"
+
+
+def _ttl_cached(func):
+    """
+    Cache the result of a query method for CACHE_TTL seconds.
+    
+    Concurrent callers share a per-method lock, so only one request is in flight
+    and the others pick up its result instead of hitting the serial link again.
+    """
+    key = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(self):
+        lock = self._cache_locks.get(key)
+        if lock is None:
+            lock = self._cache_locks[key] = asyncio.Lock()
+        async with lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < CACHE_TTL:
+                return entry[1]
+            version = self._cache_versions.get(key, 0)
+            value = await func(self)
+            # Don't store a reading that was invalidated while it was in flight
+            if self._cache_versions.get(key, 0) == version:
+                self._cache[key] = (time.monotonic(), value)
+            return value
+
+    return wrapper
+
 
 class MicroMONET:
+    # Pre-encoded bytes for the fixed commands, so they are not rebuilt on every call
+    _ENCODED = {
+        command: (command + "\n").encode("ascii")
+        for command in ("GET_POS", "LED_ON", "LED_OFF", "CCD_ON", "CCD_OFF", "GET_TEMP", "GET_HUMI", "ABORT")
+    }
+
     def __init__(self, device: str = "/dev/ttyS0", baudrate: int = 9600):
         """
         Initialize the MicroMONET class with the serial device and baudrate.
@@ -12,32 +56,136 @@ class MicroMONET:
         :param baudrate: The baudrate for serial communication (default: 9600).
         """
         self._aioserial = AioSerial(device, baudrate=baudrate)
+        if sys.platform == "linux":
+            # Ask the kernel to flush received bytes immediately instead of buffering them
+            try:
+                self._aioserial.set_low_latency_mode(True)
+            except (OSError, ValueError):
+                # Not every serial driver supports ASYNC_LOW_LATENCY (e.g., some USB adapters)
+                pass
+        self._cache = {}
+        self._cache_locks = {}
+        self._cache_versions = {}
+        # Futures waiting for a response, in the order their commands were written
+        self._pending = collections.deque()
+        self._write_lock = asyncio.Lock()
+        self._reader_task = None
+        self._rx_buf = bytearray()
+        self._ready = asyncio.Event()
+
+    async def __aenter__(self) -> "MicroMONET":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
 
-    async def send_command(self, command: str) -> str:
+    def _invalidate(self, key: str):
+        """Drop a cached reading, including one that is still being fetched."""
+        self._cache.pop(key, None)
+        self._cache_versions[key] = self._cache_versions.get(key, 0) + 1
+
+    def _ensure_reader(self):
+        """Start the background reader task if it is not running yet."""
+        if self._reader_task is None or self._reader_task.done():
+            if self._reader_task is not None and not self._reader_task.cancelled():
+                # Its error was already passed on to the commands it failed
+                self._reader_task.exception()
+            self._reader_task = asyncio.get_running_loop().create_task(self._reader())
+
+    async def _reader(self):
+        """
+        Read responses from the Arduino and hand each one to the oldest pending command.
+        """
+        try:
+            while True:
+                # Read everything the device has buffered (at least one byte) in a single call
+                data = await self._aioserial.read_async(max(1, self._aioserial.in_waiting))
+                self._rx_buf.extend(data)
+                
+                # Split complete lines out of the buffer
+                while (i := self._rx_buf.find(b"\n")) != -1:
+                    response = bytes(self._rx_buf[:i])
+                    del self._rx_buf[:i + 1]
+                    self._dispatch(response)
+        except Exception as e:
+            # Fail every outstanding command rather than leaving it waiting forever
+            while self._pending:
+                future = self._pending.popleft()
+                if not future.done():
+                    future.set_exception(e)
+            raise
+
+    def _dispatch(self, response: bytes):
+        """Hand a complete response line to the oldest pending command."""
+        if not self._ready.is_set() and READY_BANNER in response:
+            self._ready.set()
+            return
+        if not self._pending:
+            # Nobody is waiting for this line (e.g., an unsolicited message)
+            return
+        future = self._pending.popleft()
+        if not future.done():
+            future.set_result(response.rstrip(b"\r\n"))
+
+    async def send_command(self, command: str) -> bytes:
         """
         Send a command to the Arduino and wait for a response.
         
+        Commands may be issued concurrently (e.g., with asyncio.gather); they are written
+        in call order and responses are matched to them first-in, first-out.
+        
         :param command: The command to send (e.g., "GET_POS", "LED_ON", etc.).
+        :return: The raw response line from the Arduino, without the line ending.
+        """
+        data = self._ENCODED.get(command) or (command + "\n").encode("ascii")
+        return await self._send(data)
+
+    async def _send(self, data: bytes) -> bytes:
+        """
+        Write an already encoded, newline-terminated command and wait for its response.
+        
+        :param data: The raw command bytes.
         :return: The response from the Arduino.
         """
-        # Send the command to the Arduino
-        await self._aioserial.write_async((command + "\n").encode())
+        self._ensure_reader()
+        future = asyncio.get_running_loop().create_future()
+        
+        # Send the command to the Arduino, queueing its future in the same order
+        async with self._write_lock:
+            self._pending.append(future)
+            try:
+                await self._aioserial.write_async(data)
+            except asyncio.CancelledError:
+                # The bytes have most likely been written already, so keep the future
+                # queued to absorb the reply; _dispatch discards replies for done futures
+                future.cancel()
+                raise
+            except Exception:
+                # The command never reached the Arduino, so no reply will come for it
+                if future in self._pending:
+                    self._pending.remove(future)
+                raise
         
         # Wait for the response
-        response = await self._aioserial.read_until_async(b"\n")
-        return response.decode().strip()
+        return await future
 
     async def wait_for_ready(self):
         """
         Wait for the Arduino to send its "ready" message.
         """
-        while True:
-            response = await self._aioserial.read_until_async(b"\n")
-            response = response.decode().strip()
-            if "microMONET is ready for some stargazing!" in response:
-                print("Arduino is ready!")
-                break
+        self._ensure_reader()
+        reader_task = self._reader_task
+        ready_task = asyncio.ensure_future(self._ready.wait())
+        try:
+            await asyncio.wait({ready_task, reader_task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            ready_task.cancel()
+        if not self._ready.is_set():
+            # The reader stopped before the banner arrived, so pass on its error
+            reader_task.result()
+        print("Arduino is ready!")
 
+    @_ttl_cached
     async def get_position(self) -> Tuple[float, float]:
         """
         Get the current altitude and azimuth position from the Arduino.
@@ -46,18 +194,17 @@ class MicroMONET:
         """
         response = await self.send_command("GET_POS")
         
-        # Try to parse the response in the expected format (e.g., "ALT: 45.0 AZ: 90.0")
-        match = re.match(r"ALT: ([\d.]+) AZ: ([\d.]+)", response)
-        if match:
-            return float(match.group(1)), float(match.group(2))
-        
-        # Try to parse the response in the "aborted" format (e.g., "Aborted at ALT: 39.90 AZ: 246.45")
-        match = re.match(r"Aborted at ALT: ([\d.]+) AZ: ([\d.]+)", response)
-        if match:
-            return float(match.group(1)), float(match.group(2))
+        # Parse either the expected format (e.g., "ALT: 45.0 AZ: 90.0") or the
+        # "aborted" format (e.g., "Aborted at ALT: 39.90 AZ: 246.45")
+        parts = response.removeprefix(b"Aborted at ").split()
+        if len(parts) == 4 and parts[0] == b"ALT:" and parts[2] == b"AZ:":
+            try:
+                return float(parts[1]), float(parts[3])
+            except ValueError:
+                pass
         
         # If neither format matches, raise an error
-        raise ValueError(f"Invalid position response: {response}")
+        raise ValueError(f"Invalid position response: {response.decode(errors='replace')}")
 
     async def set_position(self, altitude: float, azimuth: float):
         """
@@ -66,8 +213,10 @@ class MicroMONET:
         :param altitude: The target altitude in degrees.
         :param azimuth: The target azimuth in degrees.
         """
-        command = f"ALT:{altitude} AZ:{azimuth}"
-        await self.send_command(command)
+        # Two decimals is all the Arduino uses, and keeps the command short on the wire
+        command = b"ALT:%.2f AZ:%.2f\n" % (altitude, azimuth)
+        self._invalidate("get_position")
+        await self._send(command)
 
     async def set_speed(self, speed: int):
         """
@@ -77,7 +226,7 @@ class MicroMONET:
         """
         if speed < 1 or speed > 15:
             raise ValueError("Speed must be between 1 and 15 RPM.")
-        await self.send_command(f"SET_SPEED {speed}")
+        await self._send(b"SET_SPEED %d\n" % speed)
 
     async def led_on(self):
         """Turn the LED on."""
@@ -95,6 +244,7 @@ class MicroMONET:
         """Turn the CCD LED off."""
         await self.send_command("CCD_OFF")
 
+    @_ttl_cached
     async def get_temperature(self) -> float:
         """
         Get the temperature reading from the DHT11 sensor.
@@ -103,12 +253,15 @@ class MicroMONET:
         """
         response = await self.send_command("GET_TEMP")
         # Parse the response (e.g., "Temperature: 25.0 °C")
-        match = re.match(r"Temperature: ([\d.]+)", response)
-        if match:
-            return float(match.group(1))
-        else:
-            raise ValueError(f"Invalid temperature response: {response}")
+        name, _, value = response.partition(b": ")
+        if name == b"Temperature":
+            try:
+                return float(value.split()[0])
+            except (IndexError, ValueError):
+                pass
+        raise ValueError(f"Invalid temperature response: {response.decode(errors='replace')}")
 
+    @_ttl_cached
     async def get_humidity(self) -> float:
         """
         Get the humidity reading from the DHT11 sensor.
@@ -117,16 +270,30 @@ class MicroMONET:
         """
         response = await self.send_command("GET_HUMI")
         # Parse the response (e.g., "Humidity: 50.0 %")
-        match = re.match(r"Humidity: ([\d.]+)", response)
-        if match:
-            return float(match.group(1))
-        else:
-            raise ValueError(f"Invalid humidity response: {response}")
+        name, _, value = response.partition(b": ")
+        if name == b"Humidity":
+            try:
+                return float(value.split()[0])
+            except (IndexError, ValueError):
+                pass
+        raise ValueError(f"Invalid humidity response: {response.decode(errors='replace')}")
 
     async def abort_slew(self):
         """Abort the current slew operation."""
+        self._invalidate("get_position")
         await self.send_command("ABORT")
 
     async def close(self):
         """Close the serial connection."""
+        # Stop the background reader
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+            self._reader_task = None
+        
+        # Cancel any commands still waiting for a response
+        while self._pending:
+            self._pending.popleft().cancel()
+        self._rx_buf.clear()
+        
         self._aioserial.close()
\ No newline at end of file
@@ -1,5 +1,66 @@
 from mimo import MicroMONET
 import asyncio
+import threading
+
+# Lines typed on stdin, fed by a single background reader thread (None marks EOF)
+_stdin_lines = None
+
+def _read_stdin(loop: asyncio.AbstractEventLoop, lines: asyncio.Queue):
+    """Forward every line typed on stdin to the event loop."""
+    while True:
+        try:
+            line = input()
+        except EOFError:
+            line = None
+        try:
+            loop.call_soon_threadsafe(lines.put_nowait, line)
+        except RuntimeError:
+            # The event loop has been closed
+            return
+        if line is None:
+            return
+
+async def ainput(prompt: str = "") -> str:
+    """Read a line from stdin without blocking the event loop."""
+    global _stdin_lines
+    if _stdin_lines is None:
+        _stdin_lines = asyncio.Queue()
+        # A daemon thread, so a pending input() never keeps the program from exiting
+        threading.Thread(target=_read_stdin, args=(asyncio.get_running_loop(), _stdin_lines), daemon=True).start()
+    
+    print(prompt, end="", flush=True)
+    line = await _stdin_lines.get()
+    if line is None:
+        # Leave the EOF marker for any later reader
+        _stdin_lines.put_nowait(None)
+        raise EOFError("EOF when reading a line")
+    return line
+
+async def poll_until_done(micro_monet: MicroMONET, target_alt: float, target_az: float, abort_event: asyncio.Event) -> bool:
+    """
+    Poll the position until the slew reaches its target, backing off between polls.
+    
+    :return: True if the target was reached, False if the slew was aborted.
+    """
+    interval = 0.1
+    while not abort_event.is_set():
+        alt_current, az_current = await micro_monet.get_position()
+        print(f"Current Position - ALT: {alt_current}, AZ: {az_current}")
+        
+        if abs(alt_current - target_alt) < 0.1 and abs(az_current - target_az) < 0.1:
+            return True
+        
+        await asyncio.sleep(interval)
+        interval = min(interval * 1.5, 0.5)
+    return False
+
+async def listen_for_abort(slew_task: asyncio.Task, abort_event: asyncio.Event):
+    """Set abort_event when the user types 'ABORT'."""
+    while not slew_task.done():
+        abort = (await ainput()).strip()
+        if abort.upper() == "ABORT" and not slew_task.done():
+            abort_event.set()
+            return
 
 async def main():
     # Initialize the MicroMONET class
@@ -25,7 +86,7 @@ async def main():
             print("10. Exit")
             
             # Get user input
-            choice = input("Enter your choice (1-10): ").strip()
+            choice = (await ainput("Enter your choice (1-10): ")).strip()
             
             if choice == "1":
                 # Get current position
@@ -35,26 +96,37 @@ async def main():
             elif choice == "2":
                 # Set new position
                 try:
-                    alt = float(input("Enter target altitude (degrees): "))
-                    az = float(input("Enter target azimuth (degrees): "))
+                    alt = float(await ainput("Enter target altitude (degrees): "))
+                    az = float(await ainput("Enter target azimuth (degrees): "))
                     await micro_monet.set_position(altitude=alt, azimuth=az)
                     print("Slewing to new position...")
                     
+                    print("Type 'ABORT' and press Enter at any time to stop the slew.")
+                    
                     # Wait for slew to complete or allow abort
-                    while True:
-                        alt_current, az_current = await micro_monet.get_position()
-                        print(f"Current Position - ALT: {alt_current}, AZ: {az_current}")
-                        
-                        if abs(alt_current - alt) < 0.1 and abs(az_current - az) < 0.1:
+                    abort_event = asyncio.Event()
+                    slew_task = asyncio.create_task(poll_until_done(micro_monet, alt, az, abort_event))
+                    abort_task = asyncio.create_task(listen_for_abort(slew_task, abort_event))
+                    done, _ = await asyncio.wait({slew_task, abort_task}, return_when=asyncio.FIRST_COMPLETED)
+                    
+                    if abort_event.is_set():
+                        # The mount may still have reached its target before the poller saw the abort
+                        if await slew_task:
                             print("Slew completed successfully!")
-                            break
-                        
-                        # Check if user wants to abort
-                        abort = input("Type 'ABORT' to stop the slew or press Enter to continue: ").strip()
-                        if abort.upper() == "ABORT":
+                        else:
                             await micro_monet.abort_slew()
                             print("Slew aborted!")
-                            break
+                    elif not slew_task.done():
+                        # The listener stopped (e.g., stdin was closed) before the slew finished
+                        slew_task.cancel()
+                        await asyncio.gather(slew_task, return_exceptions=True)
+                        raise abort_task.exception()
+                    else:
+                        # Stop listening; the next line typed goes to the menu instead
+                        abort_task.cancel()
+                        await asyncio.gather(abort_task, return_exceptions=True)
+                        if slew_task.result():
+                            print("Slew completed successfully!")
                 except ValueError:
                     print("Invalid input! Please enter numeric values for altitude and azimuth.")
             